@@ -44,7 +44,7 @@ class AgentThinkObservation(Observation):
         return self.content
 
 
-@dataclass
+@dataclass(slots=True)
 class MicroagentKnowledge:
     """Represents knowledge from a triggered microagent.
 
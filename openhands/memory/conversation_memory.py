@@ -60,6 +60,8 @@ class ConversationMemory:
     def __init__(self, config: AgentConfig, prompt_manager: PromptManager):
         self.agent_config = config
         self.prompt_manager = prompt_manager
+        # Checked once per recalled microagent, so keep a set for O(1) lookups
+        self.disabled_microagents = frozenset(config.disabled_microagents)
 
     @staticmethod
     def _is_valid_image_url(url: str | None) -> bool:
@@ -597,7 +599,7 @@ class ConversationMemory:
                     filtered_agents = [
                         agent
                         for agent in obs.microagent_knowledge
-                        if agent.name not in self.agent_config.disabled_microagents
+                        if agent.name not in self.disabled_microagents
                     ]
 
                 has_microagent_knowledge = bool(filtered_agents)
@@ -649,7 +651,7 @@ class ConversationMemory:
                     filtered_agents = [
                         agent
                         for agent in filtered_agents
-                        if agent.name not in self.agent_config.disabled_microagents
+                        if agent.name not in self.disabled_microagents
                     ]
 
                     # Only proceed if we still have agents after filtering out disabled ones
@@ -1,5 +1,7 @@
 import asyncio
 import os
+import threading
+import time
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
@@ -38,6 +40,59 @@ GLOBAL_MICROAGENTS_DIR = os.path.join(
 
 USER_MICROAGENTS_DIR = Path.home() / '.openhands' / 'microagents'
 
+# Parsed microagent directories are shared between Memory instances so that
+# starting a conversation doesn't re-read every markdown file from disk.
+_MICROAGENTS_CACHE_TTL = 30.0
+# Maps each directory to (mtime_ns, ttl_bucket, result) of its most recent load,
+# so a reload replaces the stale entry instead of keeping it alive next to it
+_microagents_cache: dict[
+    str,
+    tuple[int, int, tuple[dict[str, RepoMicroagent], dict[str, KnowledgeMicroagent]]],
+] = {}
+_microagents_cache_lock = threading.Lock()
+
+
+def _load_microagents_cached(
+    microagent_dir: str | Path, expires: bool = True
+) -> tuple[dict[str, RepoMicroagent], dict[str, KnowledgeMicroagent]]:
+    """Load microagents from a directory, reusing a recent result if possible.
+
+    Only the mtime of the directory itself is checked, and it only changes when
+    files are added, removed or renamed directly inside it. Edits to existing
+    files, changes in nested subdirectories and changes to the
+    .cursorrules/AGENTS.md files two levels up are not detected: they are picked
+    up once the entry expires after _MICROAGENTS_CACHE_TTL seconds, or never if
+    expires is False. The returned dicts are shared and must not be mutated.
+    """
+    path = str(microagent_dir)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        # Missing directories are memoized too; -1 never collides with a real mtime
+        mtime_ns = -1
+
+    # Non-expiring entries use bucket -1, which time.monotonic() never produces
+    ttl_bucket = int(time.monotonic() // _MICROAGENTS_CACHE_TTL) if expires else -1
+    # The lock keeps concurrent callers from parsing the same directory twice
+    with _microagents_cache_lock:
+        cached = _microagents_cache.get(path)
+        if cached is not None and cached[:2] == (mtime_ns, ttl_bucket):
+            return cached[2]
+
+        result = load_microagents_from_dir(path)
+        _microagents_cache[path] = (mtime_ns, ttl_bucket, result)
+        return result
+
+
+def preload_global_microagents() -> None:
+    """Parse the global microagents shipped with OpenHands (GLOBAL_MICROAGENTS_DIR).
+
+    They are part of the installation, so the parsed result is kept for the life
+    of the process. Only adding, removing or renaming files directly in the
+    directory triggers a reload; any other change needs a restart.
+    """
+    _load_microagents_cached(GLOBAL_MICROAGENTS_DIR, expires=False)
+
 
 class Memory:
     """Memory is a component that listens to the EventStream for information retrieval actions
@@ -77,12 +132,9 @@ class Memory:
         self.runtime_info: RuntimeInfo | None = None
         self.conversation_instructions: ConversationInstructions | None = None
 
-        # Load global microagents (Knowledge + Repo)
-        # from typically OpenHands/skills (i.e., the PUBLIC microagents)
-        self._load_global_microagents()
-
-        # Load user microagents from ~/.openhands/microagents/
-        self._load_user_microagents()
+        # Load global microagents (Knowledge + Repo) from typically OpenHands/skills
+        # (i.e., the PUBLIC microagents), then user microagents from ~/.openhands/microagents/
+        self._load_global_and_user_microagents()
 
     def on_event(self, event: Event):
         """Handle an event from the event stream."""
@@ -255,9 +307,10 @@ class Memory:
         if not query:
             return recalled_content
 
-        # Search for microagent triggers in the query
+        # Search for microagent triggers in the query, lowercasing it only once
+        lowercase_query = query.lower()
         for name, microagent in self.knowledge_microagents.items():
-            trigger = microagent.match_trigger(query)
+            trigger = microagent.match_lowercase_trigger(lowercase_query)
             if trigger:
                 logger.info("Microagent '%s' triggered by keyword '%s'", name, trigger)
                 recalled_content.append(
@@ -285,38 +338,38 @@ class Memory:
             elif isinstance(user_microagent, RepoMicroagent):
                 self.repo_microagents[user_microagent.name] = user_microagent
 
-    def _load_global_microagents(self) -> None:
-        """Loads microagents from the global microagents_dir"""
-        repo_agents, knowledge_agents = load_microagents_from_dir(
-            GLOBAL_MICROAGENTS_DIR
-        )
-        for name, agent_knowledge in knowledge_agents.items():
-            self.knowledge_microagents[name] = agent_knowledge
-        for name, agent_repo in repo_agents.items():
-            self.repo_microagents[name] = agent_repo
-
-    def _load_user_microagents(self) -> None:
-        """Loads microagents from the user's home directory (~/.openhands/microagents/)
-        Creates the directory if it doesn't exist.
+    def _load_global_and_user_microagents(self) -> None:
+        """Loads microagents from the global microagents dir and the user's home directory.
+
+        User microagents are loaded last so they override global ones with the same name.
+        Errors in the global dir are raised; errors in the user dir are only logged,
+        and the user dir is created if it doesn't exist.
         """
+        repo_agents, knowledge_agents = _load_microagents_cached(
+            GLOBAL_MICROAGENTS_DIR, expires=False
+        )
+        self._add_microagents(repo_agents, knowledge_agents)
+
         try:
-            # Create the user microagents directory if it doesn't exist
             os.makedirs(USER_MICROAGENTS_DIR, exist_ok=True)
-
-            # Load microagents from user directory
-            repo_agents, knowledge_agents = load_microagents_from_dir(
+            repo_agents, knowledge_agents = _load_microagents_cached(
                 USER_MICROAGENTS_DIR
             )
-
-            for name, agent_knowledge in knowledge_agents.items():
-                self.knowledge_microagents[name] = agent_knowledge
-            for name, agent_repo in repo_agents.items():
-                self.repo_microagents[name] = agent_repo
+            self._add_microagents(repo_agents, knowledge_agents)
         except Exception as e:
             logger.warning(
                 f'Failed to load user microagents from {USER_MICROAGENTS_DIR}: {str(e)}'
             )
 
+    def _add_microagents(
+        self,
+        repo_agents: dict[str, RepoMicroagent],
+        knowledge_agents: dict[str, KnowledgeMicroagent],
+    ) -> None:
+        """Adds loaded microagents, replacing any already loaded with the same name."""
+        self.knowledge_microagents.update(knowledge_agents)
+        self.repo_microagents.update(repo_agents)
+
     def get_microagent_mcp_tools(self) -> list[MCPConfig]:
         """Get MCP tools from all repo microagents (always active)
 
@@ -1,4 +1,5 @@
 import io
+import os
 import re
 from itertools import chain
 from pathlib import Path
@@ -191,9 +192,15 @@ class KnowledgeMicroagent(BaseMicroagent):
 
         It returns the first trigger that matches the message.
         """
-        message = message.lower()
+        return self.match_lowercase_trigger(message.lower())
+
+    def match_lowercase_trigger(self, lowercase_message: str) -> str | None:
+        """Match a trigger in a message that has already been lowercased.
+
+        Callers matching one message against many microagents can lowercase it once.
+        """
         for trigger in self.triggers:
-            if trigger.lower() in message:
+            if trigger.lower() in lowercase_message:
                 return trigger
 
         return None
@@ -312,9 +319,18 @@ def load_microagents_from_dir(
             break  # Only add the first one found to avoid duplicates
 
     # Collect .md files from microagents directory if it exists
-    md_files = []
+    # os.walk is backed by os.scandir, so each directory is listed once and entry
+    # types come from the listing instead of a stat call per entry. normcase keeps
+    # rglob's matching: case-insensitive on Windows, case-sensitive elsewhere.
+    md_files: list[Path] = []
     if microagent_dir.exists():
-        md_files = [f for f in microagent_dir.rglob('*.md') if f.name != 'README.md']
+        for root, _, filenames in os.walk(microagent_dir):
+            md_files.extend(
+                Path(root, filename)
+                for filename in filenames
+                if os.path.normcase(filename).endswith('.md')
+                and filename != 'README.md'
+            )
 
     # Process all files in one loop
     for file in chain(special_files, md_files):
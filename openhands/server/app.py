@@ -25,7 +25,9 @@ from fastapi.responses import JSONResponse
 import openhands.agenthub  # noqa F401 (we import this to get the agents registered)
 from openhands.app_server import v1_router
 from openhands.app_server.config import get_app_lifespan_service
+from openhands.core.logger import openhands_logger as logger
 from openhands.integrations.service_types import AuthenticationError
+from openhands.memory.memory import preload_global_microagents
 from openhands.server.routes.conversation import app as conversation_api_router
 from openhands.server.routes.feedback import app as feedback_api_router
 from openhands.server.routes.files import app as files_api_router
@@ -42,6 +44,7 @@ from openhands.server.routes.settings import app as settings_router
 from openhands.server.routes.trajectory import app as trajectory_router
 from openhands.server.shared import conversation_manager, server_config
 from openhands.server.types import AppMode
+from openhands.utils.async_utils import call_sync_from_async
 from openhands.version import get_version
 
 mcp_app = mcp_server.http_app(path='/mcp', stateless_http=True)
@@ -61,6 +64,13 @@ def combine_lifespans(*lifespans):
 
 @asynccontextmanager
 async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Parse the global microagents once at startup, so that the first conversation
+    # doesn't pay for it. They stay cached for the life of the process. A bad file
+    # must not stop the server; conversations still report the error when they load.
+    try:
+        await call_sync_from_async(preload_global_microagents)
+    except Exception as e:
+        logger.warning(f'Failed to preload global microagents: {e}')
     async with conversation_manager:
         yield
 
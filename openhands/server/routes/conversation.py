@@ -399,19 +399,18 @@ async def get_microagents(
 
         # Add repo microagents
         for name, r_agent in memory.repo_microagents.items():
+            metadata = r_agent.metadata
+            mcp_tools = metadata.mcp_tools
             microagents.append(
                 MicroagentResponse(
                     name=name,
                     type='repo',
                     content=r_agent.content,
                     triggers=[],
-                    inputs=r_agent.metadata.inputs,
+                    inputs=metadata.inputs,
                     tools=(
-                        [
-                            server.name
-                            for server in r_agent.metadata.mcp_tools.stdio_servers
-                        ]
-                        if r_agent.metadata.mcp_tools
+                        [server.name for server in mcp_tools.stdio_servers]
+                        if mcp_tools
                         else []
                     ),
                 )
@@ -419,19 +418,18 @@ async def get_microagents(
 
         # Add knowledge microagents
         for name, k_agent in memory.knowledge_microagents.items():
+            metadata = k_agent.metadata
+            mcp_tools = metadata.mcp_tools
             microagents.append(
                 MicroagentResponse(
                     name=name,
                     type='knowledge',
                     content=k_agent.content,
-                    triggers=k_agent.triggers,
-                    inputs=k_agent.metadata.inputs,
+                    triggers=metadata.triggers,
+                    inputs=metadata.inputs,
                     tools=(
-                        [
-                            server.name
-                            for server in k_agent.metadata.mcp_tools.stdio_servers
-                        ]
-                        if k_agent.metadata.mcp_tools
+                        [server.name for server in mcp_tools.stdio_servers]
+                        if mcp_tools
                         else []
                     ),
                 )
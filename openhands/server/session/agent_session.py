@@ -32,7 +32,6 @@ from openhands.integrations.provider import (
 from openhands.llm.llm_registry import LLMRegistry
 from openhands.mcp import add_mcp_tools_to_agent
 from openhands.memory.memory import Memory
-from openhands.microagent.microagent import BaseMicroagent
 from openhands.runtime import get_runtime_cls
 from openhands.runtime.base import Runtime
 from openhands.runtime.impl.remote.remote_runtime import RemoteRuntime
@@ -462,30 +461,36 @@ class AgentSession:
         custom_secrets_descriptions: dict[str, str],
         working_dir: str,
     ) -> Memory:
-        memory = Memory(
+        # Memory loads the global and user microagents from disk when constructed,
+        # so build it off the event loop
+        create_memory = call_sync_from_async(
+            Memory,
             event_stream=self.event_stream,
             sid=self.sid,
             status_callback=self._status_callback,
         )
-
-        if self.runtime:
-            # sets available hosts and other runtime info
-            memory.set_runtime_info(
-                self.runtime, custom_secrets_descriptions, working_dir
-            )
-            memory.set_conversation_instructions(conversation_instructions)
-
-            # loads microagents from repo/.openhands/microagents
-            microagents: list[BaseMicroagent] = await call_sync_from_async(
+        if not self.runtime:
+            return await create_memory
+
+        # loads microagents from repo/.openhands/microagents, independently of
+        # the global and user microagents, so both loads run concurrently
+        memory, microagents = await asyncio.gather(
+            create_memory,
+            call_sync_from_async(
                 self.runtime.get_microagents_from_selected_repo,
                 selected_repository or None,
-            )
-            memory.load_user_workspace_microagents(microagents)
+            ),
+        )
 
-            if selected_repository and repo_directory:
-                memory.set_repository_info(
-                    selected_repository, repo_directory, selected_branch
-                )
+        # sets available hosts and other runtime info
+        memory.set_runtime_info(self.runtime, custom_secrets_descriptions, working_dir)
+        memory.set_conversation_instructions(conversation_instructions)
+        memory.load_user_workspace_microagents(microagents)
+
+        if selected_repository and repo_directory:
+            memory.set_repository_info(
+                selected_repository, repo_directory, selected_branch
+            )
         return memory
 
     def get_state(self) -> AgentState | None:
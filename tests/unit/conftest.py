@@ -0,0 +1,11 @@
+import pytest
+
+from openhands.memory.memory import _microagents_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_microagents_cache():
+    """Parse microagent directories afresh in every test instead of reusing the module cache."""
+    _microagents_cache.clear()
+    yield
+    _microagents_cache.clear()
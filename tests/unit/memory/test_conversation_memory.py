@@ -939,6 +939,7 @@ each of which has a corresponding port:
     # Create a mock agent config
     agent_config = MagicMock(spec=AgentConfig)
     agent_config.enable_prompt_extensions = True
+    agent_config.disabled_microagents = []
 
     # Create a PromptManager
     prompt_manager = PromptManager(prompt_dir=prompt_dir)
@@ -1,7 +1,7 @@
 import asyncio
 import os
 import shutil
-import time
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -19,11 +19,12 @@ from openhands.events.observation.agent import (
     RecallType,
 )
 from openhands.events.serialization.observation import observation_from_dict
-from openhands.events.stream import EventStream
+from openhands.events.stream import EventStream, EventStreamSubscriber
 from openhands.llm import LLM
 from openhands.llm.llm_registry import LLMRegistry
 from openhands.llm.metrics import Metrics
-from openhands.memory.memory import Memory
+from openhands.memory.memory import Memory, preload_global_microagents
+from openhands.microagent import load_microagents_from_dir
 from openhands.runtime.impl.action_execution.action_execution_client import (
     ActionExecutionClient,
 )
@@ -97,6 +98,18 @@ def mock_agent():
     return agent
 
 
+def subscribe_for_recall_observation(event_stream: EventStream) -> threading.Event:
+    """Return a threading.Event that is set once a RecallObservation reaches the stream."""
+    received = threading.Event()
+
+    def on_event(event):
+        if isinstance(event, RecallObservation):
+            received.set()
+
+    event_stream.subscribe(EventStreamSubscriber.TEST, on_event, 'recall_observation')
+    return received
+
+
 @pytest.mark.asyncio
 async def test_memory_on_event_exception_handling(memory, event_stream, mock_agent):
     """Test that exceptions in Memory.on_event are properly handled via status callback."""
@@ -275,14 +288,15 @@ REPOSITORY INSTRUCTIONS: This is a test repository.
         event_stream.add_event(user_message, EventSource.USER)
 
         # Create and add the microagent action
+        recall_observation_received = subscribe_for_recall_observation(event_stream)
         microagent_action = RecallAction(
             query='First user message', recall_type=RecallType.WORKSPACE_CONTEXT
         )
         microagent_action._source = EventSource.USER  # type: ignore[attr-defined]
         event_stream.add_event(microagent_action, EventSource.USER)
 
-        # Give it a little time to process
-        time.sleep(0.3)
+        # Wait for Memory to answer the recall
+        assert recall_observation_received.wait(timeout=2.0)
 
         # Get all events from the stream
         events = list(event_stream.get_events())
@@ -376,6 +390,96 @@ async def test_memory_with_agent_microagents():
     assert 'magic word' in flarglebargle_knowledge.content
 
 
+def test_memory_reuses_cached_microagent_directories(tmp_path):
+    """Test that Memory instances share parsed microagent directories until they change."""
+    global_dir = tmp_path / 'global'
+    user_dir = tmp_path / 'user'
+    global_dir.mkdir()
+    user_dir.mkdir()
+    (global_dir / 'first.md').write_text(
+        '---\nname: first\ntriggers:\n  - first\n---\n\nFirst microagent.\n'
+    )
+
+    event_stream = MagicMock(spec=EventStream)
+    with (
+        patch('openhands.memory.memory.GLOBAL_MICROAGENTS_DIR', str(global_dir)),
+        patch('openhands.memory.memory.USER_MICROAGENTS_DIR', str(user_dir)),
+        # Keep every load inside a single TTL window
+        patch('openhands.memory.memory._MICROAGENTS_CACHE_TTL', float('inf')),
+        patch(
+            'openhands.memory.memory.load_microagents_from_dir',
+            wraps=load_microagents_from_dir,
+        ) as mock_load,
+    ):
+        first = Memory(event_stream=event_stream, sid='first-session')
+        second = Memory(event_stream=event_stream, sid='second-session')
+
+        # One load per directory, shared by both instances
+        assert mock_load.call_count == 2
+        assert 'first' in first.knowledge_microagents
+        assert 'first' in second.knowledge_microagents
+
+        # Adding a file changes the directory mtime and invalidates the cache
+        (global_dir / 'second.md').write_text(
+            '---\nname: second\ntriggers:\n  - second\n---\n\nSecond microagent.\n'
+        )
+        stat = os.stat(global_dir)
+        os.utime(global_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        third = Memory(event_stream=event_stream, sid='third-session')
+        assert mock_load.call_count == 3
+        assert 'second' in third.knowledge_microagents
+
+
+def test_global_microagents_outlive_cache_ttl(tmp_path):
+    """Test that global microagents stay cached past the TTL while user microagents expire."""
+    global_dir = tmp_path / 'global'
+    user_dir = tmp_path / 'user'
+    global_dir.mkdir()
+    user_dir.mkdir()
+
+    event_stream = MagicMock(spec=EventStream)
+    with (
+        patch('openhands.memory.memory.GLOBAL_MICROAGENTS_DIR', str(global_dir)),
+        patch('openhands.memory.memory.USER_MICROAGENTS_DIR', str(user_dir)),
+        patch(
+            'openhands.memory.memory.load_microagents_from_dir',
+            wraps=load_microagents_from_dir,
+        ) as mock_load,
+    ):
+        # Every call falls in TTL window 0 with an infinite TTL and in a later one
+        # with a 1ns TTL, so the second session sees an expired user entry
+        with patch('openhands.memory.memory._MICROAGENTS_CACHE_TTL', float('inf')):
+            Memory(event_stream=event_stream, sid='first-session')
+        with patch('openhands.memory.memory._MICROAGENTS_CACHE_TTL', 1e-9):
+            Memory(event_stream=event_stream, sid='second-session')
+
+    loaded_dirs = [call.args[0] for call in mock_load.call_args_list]
+    assert loaded_dirs == [str(global_dir), str(user_dir), str(user_dir)]
+
+
+def test_preloaded_global_microagents_are_reused(tmp_path):
+    """Test that Memory reuses the global microagents parsed by the startup preload."""
+    global_dir = tmp_path / 'global'
+    user_dir = tmp_path / 'user'
+    global_dir.mkdir()
+    user_dir.mkdir()
+
+    with (
+        patch('openhands.memory.memory.GLOBAL_MICROAGENTS_DIR', str(global_dir)),
+        patch('openhands.memory.memory.USER_MICROAGENTS_DIR', str(user_dir)),
+        patch(
+            'openhands.memory.memory.load_microagents_from_dir',
+            wraps=load_microagents_from_dir,
+        ) as mock_load,
+    ):
+        assert preload_global_microagents() is None
+        Memory(event_stream=MagicMock(spec=EventStream), sid='test-session')
+
+    loaded_dirs = [call.args[0] for call in mock_load.call_args_list]
+    assert loaded_dirs == [str(global_dir), str(user_dir)]
+
+
 @pytest.mark.asyncio
 async def test_custom_secrets_descriptions():
     """Test that custom_secrets_descriptions are properly stored in memory and included in RecallObservation."""
@@ -570,14 +674,15 @@ REPOSITORY INSTRUCTIONS: This is the second test repository.
         event_stream.add_event(user_message, EventSource.USER)
 
         # Create and add the microagent action
+        recall_observation_received = subscribe_for_recall_observation(event_stream)
         microagent_action = RecallAction(
             query='First user message', recall_type=RecallType.WORKSPACE_CONTEXT
         )
         microagent_action._source = EventSource.USER  # type: ignore[attr-defined]
         event_stream.add_event(microagent_action, EventSource.USER)
 
-        # Give it a little time to process
-        time.sleep(0.3)
+        # Wait for Memory to answer the recall
+        assert recall_observation_received.wait(timeout=2.0)
 
         # Get all events from the stream
         events = list(event_stream.get_events())
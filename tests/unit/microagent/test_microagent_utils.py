@@ -86,6 +86,23 @@ def test_knowledge_agent():
     assert agent.triggers == ['test', 'pytest']
 
 
+def test_knowledge_agent_match_lowercase_trigger():
+    """Test matching mixed-case triggers against an already lowercased message."""
+    agent = KnowledgeMicroagent(
+        name='test',
+        content='Test content',
+        metadata=MicroagentMetadata(name='test', triggers=['PyTest', 'Docker']),
+        source='test.md',
+        type=MicroagentType.KNOWLEDGE,
+    )
+
+    # The original trigger is returned, not its lowercased form
+    assert agent.match_lowercase_trigger('run pytest please') == 'PyTest'
+    assert agent.match_lowercase_trigger('build the docker image') == 'Docker'
+    assert agent.match_lowercase_trigger('no match here') is None
+    assert agent.match_trigger('Build the DOCKER image') == 'Docker'
+
+
 def test_load_microagents(temp_microagents_dir):
     """Test loading microagents from directory."""
     repo_agents, knowledge_agents = load_microagents_from_dir(temp_microagents_dir)
@@ -135,6 +152,20 @@ Testing nested directory loading.
     assert 'nested' in agent_n.triggers
 
 
+def test_load_microagents_skips_readme_and_non_files(temp_microagents_dir):
+    """Test that README.md files and directories named like markdown files are skipped."""
+    (temp_microagents_dir / 'README.md').write_text('# Microagents\n')
+    nested_dir = temp_microagents_dir / 'nested'
+    nested_dir.mkdir()
+    (nested_dir / 'README.md').write_text('# Nested microagents\n')
+    (temp_microagents_dir / 'folder.md').mkdir()
+
+    repo_agents, knowledge_agents = load_microagents_from_dir(temp_microagents_dir)
+
+    assert set(repo_agents) == {'repo'}
+    assert set(knowledge_agents) == {'knowledge'}
+
+
 def test_load_microagents_with_trailing_slashes(temp_microagents_dir):
     """Test loading microagents when directory paths have trailing slashes."""
     # Create a directory with trailing slash
@@ -24,9 +24,12 @@ from openhands.server.user_auth import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def test_client():
-    """Create a test client for the git API."""
+    """Create a test client for the git API, shared by every test in this module.
+
+    Per-test behaviour is patched on ProviderHandler, so the app itself never changes.
+    """
     app = FastAPI()
     app.include_router(git_app)
 
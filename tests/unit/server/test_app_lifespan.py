@@ -0,0 +1,24 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from openhands.server.app import _lifespan
+
+
+@pytest.mark.asyncio
+async def test_lifespan_starts_when_global_microagents_fail_to_load():
+    """A bad global microagent file is logged at startup instead of stopping the server."""
+    conversation_manager = MagicMock()
+    with (
+        patch(
+            'openhands.server.app.preload_global_microagents',
+            side_effect=ValueError('Error loading microagent from AGENTS.md'),
+        ),
+        patch('openhands.server.app.conversation_manager', conversation_manager),
+        patch('openhands.server.app.logger') as mock_logger,
+    ):
+        async with _lifespan(MagicMock()):
+            pass
+
+    conversation_manager.__aenter__.assert_awaited_once()
+    mock_logger.warning.assert_called_once()